@@ -1,15 +1,21 @@
 import csv
 import os
+import mmap
+import re
+import operator
 from tkinter import *
 from tkinter import ttk
 from tkinter import filedialog, messagebox
 from tkinter import TclError
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Iterator, Optional, Tuple
+from contextlib import contextmanager
+from functools import lru_cache
 import xml.etree.ElementTree as ET
 from pathlib import Path
 import logging
 import platform
+import queue
+import threading
 import datetime
 from enum import Enum
 
@@ -21,18 +27,50 @@ class MergeMode(Enum):
     KEEP_RECENT = "Keep most recent"
     SMART_MERGE = "Smart merge"
 
+# ADIF data specifier, <NAME:LENGTH> or <NAME:LENGTH:TYPE>
+_ADIF_FIELD_RE = re.compile(r'<([A-Za-z0-9_]+):(\d+)(?::[^>]*)?>')
+# Header and record terminators; ADIF allows any letter case, e.g. <eor>
+_ADIF_EOH_RE = re.compile(rb'<EOH>', re.IGNORECASE)
+_ADIF_EOR_RE = re.compile(rb'<EOR>', re.IGNORECASE)
+
+# Fully qualified Minos XML tags, built once rather than for every <iq>
+_MINOS_RPC_NS = "{minos:iq:rpc}"
+_TAG_IQ = "{minos:client}iq"
+_TAG_QUERY = _MINOS_RPC_NS + "query"
+_TAG_METHOD_CALL = _MINOS_RPC_NS + "methodCall"
+_TAG_METHOD_NAME = _MINOS_RPC_NS + "methodName"
+_TAG_MEMBER = _MINOS_RPC_NS + "member"
+_TAG_NAME = _MINOS_RPC_NS + "name"
+_TAG_VALUE = _MINOS_RPC_NS + "value"
+_PATH_STRUCT = f"{_MINOS_RPC_NS}params/{_MINOS_RPC_NS}param/{_MINOS_RPC_NS}value/{_MINOS_RPC_NS}struct"
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
 )
 
-@dataclass
 class ContestRecord:
-    callsign: str
-    locator: str = ""
-    exchange: str = ""
-    comment: str = ""
+    # Slots rather than a per-instance __dict__, as large logs hold many records
+    __slots__ = ('callsign', 'locator', 'exchange', 'comment', 'key', '_norm')
+
+    def __init__(self, callsign: str, locator: str = "", exchange: str = "", comment: str = ""):
+        # Surrounding whitespace is never significant, so it is dropped once here
+        callsign = callsign.strip()
+        self.callsign = callsign
+        self.locator = locator.strip()
+        self.exchange = exchange.strip()
+        self.comment = comment.strip()
+        # Upper-case callsign used to match records, so it is not re-computed per compare.
+        # Callsigns are normally upper case already, in which case the string is shared.
+        key = callsign.upper()
+        self.key = callsign if key == callsign else key
+        # Fields as compared by __eq__/__hash__; records are not modified once built
+        self._norm = (self.key, self.locator, self.exchange, self.comment)
+
+    def __repr__(self) -> str:
+        return (f"ContestRecord(callsign={self.callsign!r}, locator={self.locator!r}, "
+                f"exchange={self.exchange!r}, comment={self.comment!r})")
 
     def to_list(self) -> List[str]:
         return [self.callsign, self.locator, self.exchange, self.comment]
@@ -41,32 +79,47 @@ class ContestRecord:
     def from_list(cls, data: List[str]) -> 'ContestRecord':
         if not data:
             raise ValueError("Cannot create ContestRecord from empty data")
-        return cls(*data) if len(data) >= 4 else cls(data[0], *([""] * (4 - len(data))))
+        return cls(*data[:4])
 
     def has_more_than_callsign(self) -> bool:
         """Return True if record has any data beyond the callsign."""
-        return bool(self.locator.strip() or self.exchange.strip() or self.comment.strip())
+        return bool(self.locator or self.exchange or self.comment)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, ContestRecord):
             return False
-        return (self.callsign.upper() == other.callsign.upper() and 
-                self.locator.strip() == other.locator.strip() and 
-                self.exchange.strip() == other.exchange.strip() and 
-                self.comment.strip() == other.comment.strip())
+        return self._norm == other._norm
+
+    def __hash__(self) -> int:
+        return hash(self._norm)
 
 class ContestLogManager:
     """Manages contest log records and file operations."""
     
     HEADER = f"# Minos CSL Utility by G4CTP v{VERSION}\n# <Callsign>, <Locator>, <Exchange>, <Comment>"
-    SUPPORTED_FORMATS = {'.csl', '.edi', '.adi', '.adif', '.minos'}
+    # Loader method for each supported file extension
+    _LOADERS = {
+        '.csl': 'load_csl',
+        '.edi': 'load_edi',
+        '.adi': 'load_adif',
+        '.adif': 'load_adif',
+        '.minos': 'load_minos',
+    }
+    SUPPORTED_FORMATS = set(_LOADERS)
+    BUFFER_SIZE = 1024 * 1024  # File buffering, to cut read/write calls on large logs
+    _CSV_FIELDS = operator.attrgetter('callsign', 'locator', 'exchange', 'comment')  # One CSL row
 
     def __init__(self):
         self.records: List[ContestRecord] = []
+        # upper-case callsign -> positions of its records, oldest first
+        self._index: Dict[str, List[int]] = {}
+        self._seen: Dict[ContestRecord, int] = {}  # record -> number of identical copies held
         self.current_file: Optional[Path] = None  # Changed from Path() to None
         self.merge_mode: MergeMode = MergeMode.KEEP_ALL
         self.remove_callsign_only: bool = False
-        self._observers: List[callable] = []
+        self._observers: Tuple[callable, ...] = ()
+        self._notify_depth: int = 0
+        self._notify_pending: bool = False
         self.has_unsaved_changes: bool = False
 
     def load_file(self, filepath: str, progress_callback: Optional[callable] = None) -> None:
@@ -77,149 +130,144 @@ class ContestLogManager:
                 raise FileNotFoundError(f"File not found: {filepath}")
 
             extension = path.suffix.lower()
-            if extension not in self.SUPPORTED_FORMATS:
+            loader_name = self._LOADERS.get(extension)
+            if loader_name is None:
                 raise ValueError(f"Unsupported file format: {extension}")
+            loader = getattr(self, loader_name)
                 
             file_size = os.path.getsize(filepath)
             initial_count = len(self.records)
             logging.info(f"Starting load of {file_size/1024:.1f}KB file. Merge mode is {self.merge_mode.value}")
             
-            # Wrap progress callback to ensure it's between 0-100
+            # Wrap progress callback to ensure it's between 0-100, and only
+            # pass it on when the whole percentage changes
+            last_percentage = -1
+
             def bounded_progress(percentage: float):
+                nonlocal last_percentage
                 if progress_callback:
-                    progress_callback(min(max(percentage, 0), 100))
-            
-            if extension == '.csl':
-                self.load_csl(filepath, bounded_progress)
-            elif extension == '.edi':
-                self.load_edi(filepath, bounded_progress)
-            elif extension in {'.adi', '.adif'}:
-                self.load_adif(filepath, bounded_progress)
-            elif extension == '.minos':
-                self.load_minos(filepath, bounded_progress)
-
-            final_count = len(self.records)
-            logging.info(f"Finished loading. Records count: {final_count}")
+                    whole = int(min(max(percentage, 0), 100))
+                    if whole != last_percentage:
+                        last_percentage = whole
+                        progress_callback(whole)
             
-            self.current_file = path
-            self.has_unsaved_changes = True
-            self.notify_observers()
+            # Observers hear about the load once, not once per record
+            with self.batched_notifications():
+                loader(filepath, bounded_progress)
+
+                final_count = len(self.records)
+                logging.info(f"Finished loading. Records count: {final_count}")
+                
+                self.current_file = path
+                self.has_unsaved_changes = True
+                self.notify_observers()
             
-        except Exception as e:
+        except (OSError, ValueError, csv.Error, ET.ParseError) as e:
             logging.error(f"Failed to load {Path(filepath).suffix} file: {str(e)}")
-            raise
+            raise IOError(f"Failed to load {Path(filepath).suffix} file: {e}") from e
+
+    def load_files(self, filepaths: List[str], progress_callback: Optional[callable] = None) -> None:
+        """Load several files in the order given, notifying observers once at the end.
+
+        Merging follows the order of the list, so pass the oldest file first.
+        Progress is reported across all of the files as a whole.
+        """
+        with self.batched_notifications():
+            for number, filepath in enumerate(filepaths):
+                file_progress = None
+                if progress_callback:
+                    def file_progress(percentage: float, number: int = number):
+                        progress_callback((number * 100 + percentage) / len(filepaths))
+                self.load_file(filepath, file_progress)
 
     def load_edi(self, filename: str, progress_callback: Optional[callable] = None) -> None:
-        """Load EDI format file with progress tracking."""
+        """Load EDI format file with progress tracking.
+
+        [Remarks] comes before [QSORecords;...] in an EDI file, so the comments
+        are collected and the QSOs emitted in a single streaming pass.
+        """
         total_size = os.path.getsize(filename)
-        bytes_read = 0
 
-        with open(filename, "r", encoding='utf-8') as f:
-            lines = f.readlines()
+        with open(filename, "r", encoding='utf-8', buffering=self.BUFFER_SIZE) as f:
             comments: Dict[str, str] = {}
             in_qso_section = False
             in_remarks = False
-            
-            # Calculate total lines for progress
-            total_lines = len(lines)
-            processed_lines = 0
-
-            # First pass: collect comments
-            for line in lines:
-                line = line.strip()
-                processed_lines += 1
-                if progress_callback:
-                    progress = (processed_lines / (total_lines * 2)) * 100  # First pass = 0-50%
-                    progress_callback(progress)
 
-                if line.startswith('[Remarks]'):
-                    in_remarks = True
-                    continue
-                elif line.startswith('[QSORecords;'):
-                    in_remarks = False
+            for line in f:
+                # Progress in bytes, to match total_size; the decoder reads at most
+                # a few KB ahead of the current line
+                if progress_callback and total_size:
+                    progress_callback((f.buffer.tell() / total_size) * 100)
+                line = line.rstrip('\r\n')
+
+                # Only section headers start with '[', so data lines skip these tests
+                if line.startswith('['):
+                    if line.startswith('[Remarks]'):
+                        in_remarks = True
+                    elif line.startswith('[QSORecords;'):
+                        in_remarks = False
+                        in_qso_section = True
+                    elif line.startswith('[END;'):
+                        break
                     continue
 
+                # Split only as far as the last field used; the rest of the line is left whole
                 if in_remarks and line:
-                    try:
-                        fields = line.split(';')
-                        if len(fields) >= 4:
-                            comments[fields[2].strip()] = fields[3].strip()
-                    except IndexError:
-                        continue
-
-            # Reset for second pass
-            processed_lines = 0
-            in_qso_section = False
-
-            # Second pass: process QSOs
-            for line in lines:
-                line = line.strip()
-                processed_lines += 1
-                if progress_callback:
-                    progress = 50 + (processed_lines / (total_lines * 2)) * 100  # Second pass = 50-100%
-                    progress_callback(min(progress, 100))
-
-                if line.startswith('[QSORecords;'):
-                    in_qso_section = True
-                    continue
-                elif line.startswith('[END;'):
-                    break
+                    fields = line.split(';', 4)
+                    if len(fields) >= 4:
+                        comments[fields[2].strip()] = fields[3].strip()
 
                 if in_qso_section and line:
-                    try:
-                        fields = line.split(';')
-                        if len(fields) >= 10:  # Ensure we have enough fields
-                            record = ContestRecord(
-                                callsign=fields[2].strip(),
-                                locator=fields[9].strip(),
-                                exchange=fields[8].strip(),
-                                comment=comments.get(fields[2].strip(), "")
-                            )
-                            self.add_or_merge_record(record)
-                    except IndexError:
-                        continue
+                    fields = line.split(';', 10)
+                    if len(fields) >= 10:  # Ensure we have enough fields
+                        callsign = fields[2].strip()
+                        record = ContestRecord(
+                            callsign=callsign,
+                            locator=fields[9],
+                            exchange=fields[8],
+                            comment=comments.get(callsign, "")
+                        )
+                        self.add_or_merge_record(record)
 
     def load_adif(self, filename: str, progress_callback: Optional[callable] = None) -> None:
-        """Load ADIF format file with progress tracking."""
-        total_size = os.path.getsize(filename)
-        bytes_read = 0
+        """Load ADIF format file with progress tracking.
 
-        with open(filename, "r", encoding='utf-8') as f:
-            content = f.read()
-            
-            if '<EOH>' in content:
-                _, qsos = content.split('<EOH>', 1)
-            else:
-                qsos = content
+        The file is memory-mapped and scanned for record markers in place, so
+        only each QSO's own bytes are copied out and decoded.
+        """
+        total_size = os.path.getsize(filename)
+        if total_size == 0:
+            return
 
-            total_length = len(qsos)
-            processed_length = 0
+        with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            eoh = _ADIF_EOH_RE.search(mm)
+            pos = eoh.end() if eoh else 0
 
-            while qsos.strip():
-                eor_index = qsos.find('<EOR>')
-                if eor_index == -1:
+            while True:
+                eor = _ADIF_EOR_RE.search(mm, pos)
+                if eor is None:
                     break
 
-                qso = qsos[:eor_index].strip()
-                qsos = qsos[eor_index + 5:].strip()
+                qso = mm[pos:eor.start()].decode('utf-8')
+                pos = eor.end()
                 
-                processed_length += eor_index + 5
                 if progress_callback:
-                    progress = (processed_length / total_length) * 100
+                    progress = (pos / total_size) * 100
                     progress_callback(min(progress, 100))
 
+                fields = self.extract_adif_fields(qso)
                 record = ContestRecord(
-                    callsign=self.extract_adif_field(qso, 'CALL'),
-                    locator=self.extract_adif_field(qso, 'GRIDSQUARE'),
-                    exchange=self.extract_adif_field(qso, 'QTH'),
-                    comment=self.extract_adif_field(qso, 'COMMENT')
+                    callsign=fields.get('CALL', ''),
+                    locator=fields.get('GRIDSQUARE', ''),
+                    exchange=fields.get('QTH', ''),
+                    comment=fields.get('COMMENT', '')
                 )
                 
                 if record.callsign:  # Only add records with a callsign
                     self.add_or_merge_record(record)
 
     def load_minos(self, filename: str, progress_callback: Optional[callable] = None) -> None:
-        """Load Minos format file with progress tracking and comprehensive error handling.
+        """Load Minos format file with progress tracking.
         
         Args:
             filename (str): Path to the Minos file to load
@@ -227,158 +275,184 @@ class ContestLogManager:
             
         Raises:
             FileNotFoundError: If the file doesn't exist
-            IOError: If there are issues reading the file
+            OSError: If there are issues reading the file
             ValueError: If the file format is invalid
             ET.ParseError: If the XML is malformed
             
         The method processes Minos XML format files, which contain QSO records with
-        detailed contact information. It supports progress tracking and implements
-        the specified merge mode for duplicate contacts.
+        detailed contact information. The file is parsed incrementally and each
+        <iq> element is emptied once its QSO has been extracted, so only a bare
+        element per record is kept while loading. QSOs are only merged once the
+        whole file has parsed, so a damaged or truncated file adds nothing. It
+        supports progress tracking and implements the specified merge mode for
+        duplicate contacts.
         """
-        try:
-            total_size = os.path.getsize(filename)
-            bytes_read = 0
-
-            with open(filename, 'r', encoding='utf-8') as file:
-                # Read and clean XML content
-                content = file.read()
-                stream_start = content.find('<stream:stream')
-                if stream_start == -1:
-                    raise ValueError("Invalid Minos file format: No stream element found")
-                    
-                clean_content = content[stream_start:]
-                if '</stream:stream>' not in clean_content:
-                    clean_content += '</stream:stream>'
+        total_size = os.path.getsize(filename)
+        if total_size == 0:
+            raise ValueError("Invalid Minos file format: No stream element found")
+
+        with open(filename, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # End events only; asking for start events as well, just to catch the
+            # root, would double the events handled in Python
+            parser = ET.XMLPullParser(events=('end',))
+            processed_iqs = 0
+            qso_records: List[ContestRecord] = []
+            
+            for data, position in self._minos_chunks(mm):
+                parser.feed(data)
 
-                try:
-                    root = ET.fromstring(clean_content)
-                except ET.ParseError as e:
-                    raise ValueError(f"Invalid XML in Minos file: {str(e)}")
+                for _, elem in parser.read_events():
+                    if elem.tag != _TAG_IQ:
+                        continue
 
-                # Define XML namespaces
-                ns = "{minos:iq:rpc}"
-                ns_client = "{minos:client}"
-                
-                # Count total IQ elements for progress tracking
-                total_iqs = len(root.findall(f".//{ns_client}iq"))
-                if total_iqs == 0:
-                    raise ValueError("No QSO records found in file")
-                    
-                processed_iqs = 0
-                qso_count = 0
-                
-                # Process each IQ element
-                for iq in root.findall(f".//{ns_client}iq"):
                     processed_iqs += 1
-                    
-                    # Update progress
-                    if progress_callback:
-                        progress = (processed_iqs / total_iqs) * 100
-                        progress_callback(min(progress, 100))  # Ensure progress doesn't exceed 100%
-
-                    # Find and process query element
-                    query = iq.find(f"{ns}query")
-                    if query is None:
-                        continue
+                    record = self._minos_qso_record(elem)
+                    if record is not None:
+                        qso_records.append(record)
 
-                    # Find and process method call element
-                    method_call = query.find(f"{ns}methodCall")
-                    if method_call is None:
-                        continue
+                    # Free the processed element; only its empty shell stays in the stream
+                    elem.clear()
 
-                    # Check if this is a QSO record
-                    method_name = method_call.find(f"{ns}methodName")
-                    if method_name is None or method_name.text != "MinosLogQSO":
-                        continue
+                # Update progress
+                if progress_callback:
+                    progress_callback(min(position / total_size * 100, 100))
 
-                    # Process QSO parameters
-                    params = method_call.find(f"{ns}params/{ns}param/{ns}value/{ns}struct")
-                    if params is not None:
-                        # Extract QSO data from XML structure
-                        qso_data = {}
-                        for member in params.findall(f"{ns}member"):
-                            name_elem = member.find(f"{ns}name")
-                            value_elem = member.find(f"{ns}value")
-                            if name_elem is not None and value_elem is not None:
-                                for child in value_elem:
-                                    qso_data[name_elem.text] = child.text
-                                    break
-
-                        # Create contest record if valid callsign exists
-                        if 'callRx' in qso_data and qso_data['callRx']:
-                            # Combine comments if they exist and are different
-                            comments = []
-                            if qso_data.get('commentsTx'):
-                                comments.append(qso_data['commentsTx'])
-                            if qso_data.get('commentsRx') and qso_data['commentsRx'] != qso_data.get('commentsTx'):
-                                comments.append(qso_data['commentsRx'])
-                                
-                            # Create and add the record
-                            record = ContestRecord(
-                                callsign=qso_data.get('callRx', '').strip(),
-                                locator=qso_data.get('locRx', '').strip(),
-                                exchange=qso_data.get('exchangeRx', '').strip(),
-                                comment=" | ".join(comments)
-                            )
-                            self.add_or_merge_record(record)
-                            qso_count += 1
-
-                # Log completion
-                logging.info(f"Finished loading Minos file. Processed {qso_count} QSOs from {processed_iqs} records.")
-                if qso_count == 0:
-                    logging.warning("No valid QSO records were found in the file.")
-
-        except FileNotFoundError:
-            logging.error(f"Minos file not found: {filename}")
-            raise
-        except ET.ParseError as e:
-            logging.error(f"XML parsing error in Minos file: {str(e)}")
-            raise ValueError(f"Failed to parse Minos file: {str(e)}")
-        except Exception as e:
-            logging.error(f"Unexpected error loading Minos file: {str(e)}")
-            raise IOError(f"Failed to load Minos file: {str(e)}")
+            parser.close()
+
+            # Parsing succeeded, so the records can be merged
+            for record in qso_records:
+                self.add_or_merge_record(record)
+            qso_count = len(qso_records)
+
+            # Counted per file, so this also holds when records were already loaded
+            if processed_iqs == 0:
+                raise ValueError("No QSO records found in file")
+
+            # Log completion
+            logging.info(f"Finished loading Minos file. Processed {qso_count} QSOs from {processed_iqs} records.")
+            if qso_count == 0:
+                # A log with no contacts yet, such as a newly set up contest, is still valid
+                logging.warning("No valid QSO records were found in the file.")
+
+    def _minos_chunks(self, mm: mmap.mmap, chunk_size: int = 64 * 1024) -> Iterator[Tuple[bytes, int]]:
+        """Yield (chunk, end offset) pairs covering a Minos log from its stream element onwards.
+
+        Minos keeps appending to the log while a contest is running, so the
+        closing stream tag is supplied if the file does not contain one.
+        """
+        stream_start = mm.find(b'<stream:stream')
+        if stream_start == -1:
+            raise ValueError("Invalid Minos file format: No stream element found")
+
+        size = len(mm)
+        for pos in range(stream_start, size, chunk_size):
+            end = min(pos + chunk_size, size)
+            yield mm[pos:end], end
+
+        if mm.rfind(b'</stream:stream>', stream_start) == -1:
+            yield b'</stream:stream>', size
+
+    def _minos_qso_record(self, iq: ET.Element) -> Optional[ContestRecord]:
+        """Build a ContestRecord from a MinosLogQSO <iq> element, or None if it is not one."""
+        # Find and process query element
+        query = iq.find(_TAG_QUERY)
+        if query is None:
+            return None
+
+        # Find and process method call element
+        method_call = query.find(_TAG_METHOD_CALL)
+        if method_call is None:
+            return None
+
+        # Check if this is a QSO record
+        method_name = method_call.find(_TAG_METHOD_NAME)
+        if method_name is None or method_name.text != "MinosLogQSO":
+            return None
+
+        # Process QSO parameters
+        params = method_call.find(_PATH_STRUCT)
+        if params is None:
+            return None
+
+        # Extract QSO data from XML structure
+        qso_data = {}
+        for member in params.iterfind(_TAG_MEMBER):
+            name_elem = member.find(_TAG_NAME)
+            value_elem = member.find(_TAG_VALUE)
+            # The value is held in its first child, e.g. <string> or <int>
+            if name_elem is not None and value_elem is not None and len(value_elem):
+                qso_data[name_elem.text] = value_elem[0].text
+
+        # Create contest record if valid callsign exists; empty <string/>
+        # values come through as None, so fall back to ''
+        get = qso_data.get
+        callsign = get('callRx') or ''
+        if not callsign.strip():
+            return None
+
+        # Combine comments if they exist and are different
+        comment_tx = get('commentsTx') or ''
+        comment_rx = get('commentsRx') or ''
+        comments = []
+        if comment_tx:
+            comments.append(comment_tx)
+        if comment_rx and comment_rx != comment_tx:
+            comments.append(comment_rx)
+
+        return ContestRecord(
+            callsign=callsign,
+            locator=get('locRx') or '',
+            exchange=get('exchangeRx') or '',
+            comment=" | ".join(comments)
+        )
 
     def load_csl(self, filename: str, progress_callback: Optional[callable] = None) -> None:
-        """Load CSL format file with progress tracking."""
+        """Load CSL format file with progress tracking.
+
+        Rows whose first field starts with '#', such as the header written by
+        save_csl, are skipped after parsing, so quoted fields that span lines
+        are read intact.
+        """
         total_size = os.path.getsize(filename)
         
-        with open(filename, "r", encoding='utf-8') as f:
-            # Read all lines for progress tracking
-            lines = f.readlines()
-            total_lines = len(lines)
-            processed_lines = 0
-            
-            reader = csv.reader(lines)
-            first_line = next(reader, None)
-            
-            if first_line and not first_line[0].startswith('#'):
-                self.add_or_merge_record(ContestRecord.from_list(
-                    [field.strip() for field in first_line]))
-                processed_lines += 1
-                if progress_callback:
-                    progress_callback((processed_lines / total_lines) * 100)
-            
-            for row in reader:
-                processed_lines += 1
-                if row:  # Skip empty rows
-                    self.add_or_merge_record(ContestRecord.from_list(
-                        [field.strip() for field in row]))
+        with open(filename, "r", encoding='utf-8', buffering=self.BUFFER_SIZE) as f:
+            # Keeping every distinct record needs no merge decision per row
+            if self.merge_mode == MergeMode.KEEP_ALL and not self.remove_callsign_only:
+                add_record = self._add_unique_record
+            else:
+                add_record = self.add_or_merge_record
+
+            for row in csv.reader(f):
+                if row and not row[0].lstrip().startswith('#'):  # Skip empty and comment rows
+                    columns = len(row)
+                    add_record(ContestRecord(
+                        row[0],
+                        row[1] if columns > 1 else "",
+                        row[2] if columns > 2 else "",
+                        row[3] if columns > 3 else ""
+                    ))
                 
-                if progress_callback:
-                    progress_callback((processed_lines / total_lines) * 100)
+                # Progress in bytes, as for load_edi
+                if progress_callback and total_size:
+                    progress_callback((f.buffer.tell() / total_size) * 100)
 
     def save_csl(self, filename: str) -> None:
         """Save to CSL format with error handling."""
         try:
-            with open(filename, "w", newline='', encoding='utf-8') as f:
+            with open(filename, "w", newline='', encoding='utf-8', buffering=self.BUFFER_SIZE) as f:
                 f.write(self.HEADER + '\n')
                 writer = csv.writer(f)
-                writer.writerows([r.to_list() for r in self.records])
+                writer.writerows(map(self._CSV_FIELDS, self.records))
             self.has_unsaved_changes = False
             self.notify_observers()
         except Exception as e:
             raise IOError(f"Failed to save file: {str(e)}")
 
+    @property
+    def record_count(self) -> int:
+        """Number of records currently held."""
+        return len(self.records)
+
     def set_merge_mode(self, mode: MergeMode):
         """Set the merge mode."""
         self.merge_mode = mode
@@ -398,67 +472,116 @@ class ContestLogManager:
         if self.remove_callsign_only and not new_record.has_more_than_callsign():
             return
 
-        existing_records = [r for r in self.records if r.callsign.upper() == new_record.callsign.upper()]
+        positions = self._index.get(new_record.key)
 
         if self.merge_mode == MergeMode.KEEP_ALL:
-            if new_record not in self.records:
-                self.records.append(new_record)
+            if new_record not in self._seen:
+                self._append_record(new_record)
                 
         elif self.merge_mode == MergeMode.KEEP_RECENT:
-            if existing_records:
-                self.records.remove(existing_records[0])
-            self.records.append(new_record)
+            if positions is None:
+                self._append_record(new_record)
+            else:
+                # The oldest record for the callsign gives way, and its slot
+                # becomes the newest
+                idx = positions.pop(0)
+                positions.append(idx)
+                # Re-loading the same record is common; leave it in place then
+                existing_record = self.records[idx]
+                if new_record != existing_record or new_record.callsign != existing_record.callsign:
+                    self._replace_record(idx, new_record)
             
         elif self.merge_mode == MergeMode.SMART_MERGE:
-            if existing_records:
-                existing_record = existing_records[0]
+            if positions is None:
+                self._append_record(new_record)
+            elif new_record.has_more_than_callsign():  # A bare callsign has nothing to merge
+                idx = positions[0]  # Merge into the oldest record for the callsign
+                existing_record = self.records[idx]
                 merged_record = ContestRecord(
                     callsign=existing_record.callsign,
-                    locator=new_record.locator if new_record.locator.strip() else existing_record.locator,
-                    exchange=new_record.exchange if new_record.exchange.strip() else existing_record.exchange,
-                    comment=new_record.comment if new_record.comment.strip() else existing_record.comment
+                    locator=new_record.locator or existing_record.locator,
+                    exchange=new_record.exchange or existing_record.exchange,
+                    comment=new_record.comment or existing_record.comment
                 )
-                self.records[self.records.index(existing_record)] = merged_record
-            else:
-                self.records.append(new_record)
+                if merged_record != existing_record:
+                    self._replace_record(idx, merged_record)
         
         self.has_unsaved_changes = True
         self.notify_observers()
 
+    def _add_unique_record(self, record: ContestRecord) -> None:
+        """KEEP_ALL fast path for loaders; load_file flags and notifies once."""
+        if record.callsign and record not in self._seen:
+            self._append_record(record)
+
+    def _append_record(self, record: ContestRecord) -> None:
+        """Append a record, indexing it as the newest for its callsign."""
+        self._index.setdefault(record.key, []).append(len(self.records))
+        self._seen[record] = self._seen.get(record, 0) + 1
+        self.records.append(record)
+
+    def _replace_record(self, idx: int, record: ContestRecord) -> None:
+        """Replace the record at idx, keeping the duplicate counts in step."""
+        old_record = self.records[idx]
+        if self._seen[old_record] > 1:
+            self._seen[old_record] -= 1
+        else:
+            del self._seen[old_record]
+        self._seen[record] = self._seen.get(record, 0) + 1
+        self.records[idx] = record
+
     def add_observer(self, callback: callable):
         """Add observer for record changes."""
-        self._observers.append(callback)
+        self._observers += (callback,)
 
     def notify_observers(self):
         """Notify observers of record changes."""
+        if self._notify_depth:
+            self._notify_pending = True
+            return
         for callback in self._observers:
             callback()
 
+    @contextmanager
+    def batched_notifications(self):
+        """Hold back observer notifications, sending at most one when the block exits."""
+        self._notify_depth += 1
+        try:
+            yield
+        finally:
+            self._notify_depth -= 1
+            if not self._notify_depth and self._notify_pending:
+                self._notify_pending = False
+                self.notify_observers()
+
     def reset(self) -> None:
         """Clear all records."""
-        if self.records:  # Only set unsaved changes if there were records
-            self.has_unsaved_changes = True
+        if not self.records:  # Nothing to clear, so nothing to tell observers
+            return
+        self.has_unsaved_changes = True
         self.records = []
+        self._index.clear()
+        self._seen.clear()
         self.notify_observers()
 
-    def extract_adif_field(self, qso: str, field: str) -> str:
-        """Extract field from ADIF record."""
-        field_start = qso.upper().find(f'<{field.upper()}')
-        if field_start == -1:
-            return ""
-
-        field_end = qso.find('>', field_start)
-        if field_end == -1:
-            return ""
-
-        try:
-            length = int(qso[field_start:field_end].split(':')[1].split(':')[0])
-            value_start = field_end + 1
-            return qso[value_start:value_start + length].strip()
-        except (IndexError, ValueError):
-            return ""
+    def extract_adif_fields(self, qso: str) -> Dict[str, str]:
+        """Extract all fields from an ADIF record, keyed by upper-case field name."""
+        fields: Dict[str, str] = {}
+        pos = 0
+        while True:
+            match = _ADIF_FIELD_RE.search(qso, pos)
+            if match is None:
+                return fields
+
+            # Continue after the value, so a '<' inside it is not taken for a field
+            value_start = match.end()
+            pos = value_start + int(match.group(2))
+            fields.setdefault(match.group(1).upper(), qso[value_start:pos].strip())
         
 class ContestLogUI:
+    POLL_INTERVAL_MS = 50  # How often the window checks on a background load
+    MAX_STATUS_LINES = 1000  # Status lines kept; the Text widget slows as it grows
+
     def __init__(self):
         self.window = None
         self.progress_frame = None
@@ -472,9 +595,15 @@ class ContestLogUI:
         self.merge_mode_var = None
         self.remove_callsign_var = None
         self.loading = False
-        self.status_messages = []
+        self._pending_status = []  # Status lines waiting for the next idle flush
+        self._status_flush_scheduled = False
+        self._display_update_scheduled = False  # update_display queued by schedule_display_update
         self.manager = manager  # Should be set by the caller
         self.system = platform.system()
+        # macOS ignores bg on buttons, so colours go through highlightbackground there
+        self._button_bg_option = 'highlightbackground' if self.system == "Darwin" else 'bg'
+        self._last_button_state = None  # (state, colour) last applied to the save button
+        self._buttons = []  # Every button and option control, for disabling while a file loads
         
         # Initialize the UI immediately in __init__
         self.setup_ui()
@@ -509,13 +638,16 @@ class ContestLogUI:
         self.merge_mode_var = StringVar(value=MergeMode.KEEP_ALL.value)
         
         for idx, mode in enumerate(MergeMode):
-            ttk.Radiobutton(
+            radio = ttk.Radiobutton(
                 options_frame,
                 text=mode.value,
                 variable=self.merge_mode_var,
                 value=mode.value,
                 command=self.update_merge_mode
-            ).grid(row=idx, column=0, sticky="w")
+            )
+            radio.grid(row=idx, column=0, sticky="w")
+            # The loader thread reads the merge options, so they are locked during a load
+            self._buttons.append(radio)
 
         # Add separator between merge options and checkbox
         ttk.Separator(options_frame, orient='horizontal').grid(
@@ -523,12 +655,14 @@ class ContestLogUI:
 
         # Add checkbox for callsign-only removal
         self.remove_callsign_var = BooleanVar(value=False)
-        ttk.Checkbutton(
+        remove_callsign_check = ttk.Checkbutton(
             options_frame,
             text="Remove callsign-only records",
             variable=self.remove_callsign_var,
             command=self.update_remove_callsign
-        ).grid(row=len(MergeMode)+1, column=0, sticky="w")
+        )
+        remove_callsign_check.grid(row=len(MergeMode)+1, column=0, sticky="w")
+        self._buttons.append(remove_callsign_check)
 
         # Buttons frame
         button_frame = ttk.LabelFrame(top_section, text="File Operations", padding="5")
@@ -543,8 +677,9 @@ class ContestLogUI:
         ]
 
         for idx, (text, command) in enumerate(button_configs):
-            ttk.Button(button_frame, text=text, command=command).grid(
-                row=idx, column=0, sticky="ew", pady=2)
+            button = ttk.Button(button_frame, text=text, command=command)
+            button.grid(row=idx, column=0, sticky="ew", pady=2)
+            self._buttons.append(button)
 
         # Create frames for save and reset buttons
         bottom_buttons_frame = ttk.Frame(button_frame)
@@ -591,6 +726,7 @@ class ContestLogUI:
                 relief=RAISED
             )
         self.reset_button.grid(row=1, column=0, sticky="ew", pady=(2, 0))
+        self._buttons += [self.save_button, self.reset_button]
 
         # Configure bottom_buttons_frame grid
         bottom_buttons_frame.grid_columnconfigure(0, weight=1)
@@ -682,7 +818,6 @@ class ContestLogUI:
         self.progress_label.grid()
         self.loading = True
         self.disable_buttons()
-        self.window.update_idletasks()
 
     def hide_progress(self):
         """Hide progress bar and label."""
@@ -691,7 +826,6 @@ class ContestLogUI:
             self.progress_label.grid_remove()
             self.loading = False
             self.enable_buttons()
-            self.window.update_idletasks()
         except TclError as e:
             logging.error(f"Failed to hide progress bar: {str(e)}")
 
@@ -701,37 +835,38 @@ class ContestLogUI:
             self.progress_var.set(percentage)
             if message:
                 self.progress_label.configure(text=message)
-            self.window.update_idletasks()
         except TclError as e:
             logging.error(f"Failed to update progress: {str(e)}")
 
     def update_count_bar(self):
         """Update count bar text and ensure visibility."""
         try:
-            count = len(self.manager.records)
+            count = self.manager.record_count
             self.count_bar.configure(text=f"Number of rows: {count}")
             self.count_bar.grid()  # Ensure visibility
-            self.window.update_idletasks()
         except TclError as e:
             logging.error(f"Failed to update count bar: {str(e)}")
 
     def disable_buttons(self):
-        """Disable all buttons during file loading."""
-        for widget in self.window.winfo_children():
-            if isinstance(widget, (ttk.Button, Button)):
-                widget.configure(state='disabled')
-        self.window.update_idletasks()
+        """Disable all buttons and options during file loading."""
+        for button in self._buttons:
+            button.configure(state='disabled')
+        self._last_button_state = None  # Buttons changed behind update_save_button_state
 
     def enable_buttons(self):
-        """Re-enable all buttons after file loading."""
-        for widget in self.window.winfo_children():
-            if isinstance(widget, (ttk.Button, Button)):
-                widget.configure(state='normal')
-        self.update_save_button_state()
-        self.window.update_idletasks()
+        """Re-enable all buttons and options after file loading."""
+        for button in self._buttons:
+            button.configure(state='normal')
+        self.update_save_button_state()  # Save/reset stay disabled without records
 
     def load_file(self, file_types: List[Tuple[str, str]]):
-        """Generic file loading method with progress tracking."""
+        """Generic file loading method with progress tracking.
+
+        The file is parsed on a background thread so the window stays
+        responsive; progress and the result are picked up by _poll_load.
+        """
+        if self.loading:
+            return
         filename = filedialog.askopenfilename(filetypes=file_types)
         if filename:
             try:
@@ -745,23 +880,64 @@ class ContestLogUI:
                 else:
                     self.update_status(f"Loading file ({file_size/1024:.1f} KB)...")
                 
-                def progress_callback(percentage):
-                    self.update_progress(percentage, f"Loading: {percentage:.1f}%")
-                
-                self.manager.load_file(filename, progress_callback)
-                self.update_status(f"Loaded: {self.truncate_path(filename)}")
-                
             except Exception as e:
-                messagebox.showerror("Error", str(e))
-                self.update_status("Error loading file")
-            finally:
+                logging.error(f"Failed to start loading {filename}: {e}")
+                self.update_status(f"Error loading {self.truncate_path(filename)}: {e}")
                 self.hide_progress()
-                self.update_count_bar()
-                self.window.update_idletasks()
+                return
+
+            # Tk must only be used from the main thread, so the worker reports back through a queue
+            load_queue = queue.Queue()
+
+            def worker():
+                try:
+                    self.manager.load_file(filename, lambda percentage: load_queue.put(('progress', percentage)))
+                except Exception as e:
+                    logging.exception(f"Failed to load {filename}")
+                    load_queue.put(('error', e))
+                else:
+                    load_queue.put(('done', None))
+
+            threading.Thread(target=worker, daemon=True).start()
+            self.window.after(self.POLL_INTERVAL_MS, self._poll_load, filename, load_queue)
+
+    def _poll_load(self, filename: str, load_queue: queue.Queue):
+        """Show progress from the loader thread and finish up once it is done."""
+        percentage = None
+        result = None
+        while result is None:
+            try:
+                kind, value = load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                percentage = value  # Only the latest value is worth drawing
+            else:
+                result = (kind, value)
+
+        if percentage is not None:
+            self.update_progress(percentage, f"Loading: {percentage:.1f}%")
+
+        if result is None:
+            self.window.after(self.POLL_INTERVAL_MS, self._poll_load, filename, load_queue)
+            return
+
+        kind, value = result
+        if kind == 'error':
+            # Reported in the status log rather than a modal dialog; the worker has logged it
+            self.update_status(f"Error loading {self.truncate_path(filename)}: {value}")
+        else:
+            self.update_status(f"Loaded: {self.truncate_path(filename)}")
+
+        self.hide_progress()
+        # The manager's notification came from the worker thread, so refresh here
+        self.update_display()
 
     def save_csl(self):
         """Save to CSL format file with default filename."""
-        default_name = f"Minos Archive {datetime.date.today().strftime('%Y-%m-%d')}.csl"
+        if self.loading:
+            return  # Records are still being added by the loader thread
+        default_name = f"Minos Archive {datetime.date.today().isoformat()}.csl"
         filename = filedialog.asksaveasfilename(
             defaultextension=".csl",
             initialfile=default_name,
@@ -777,7 +953,7 @@ class ContestLogUI:
 
     def update_merge_mode(self):
         """Update merge mode setting in manager."""
-        selected_mode = next(mode for mode in MergeMode if mode.value == self.merge_mode_var.get())
+        selected_mode = MergeMode(self.merge_mode_var.get())  # Enum lookup by value
         self.manager.set_merge_mode(selected_mode)
         self.update_status(f"Merge mode set to: {selected_mode.value}")
 
@@ -789,62 +965,88 @@ class ContestLogUI:
 
     def confirm_reset(self):
         """Show confirmation dialog before resetting."""
-        if len(self.manager.records) > 0:
+        if self.loading:
+            return
+        if self.manager.record_count > 0:
             if messagebox.askyesno("Confirm Reset", 
                                  "Are you sure you want to clear all records? This cannot be undone."):
-                self.manager.reset()
+                self.manager.reset()  # Observers refresh the count bar
                 self.update_status("All records cleared")
-                self.update_count_bar()
      
     def update_save_button_state(self):
         """Update save button state based on record count and unsaved changes."""
         try:
-            has_records = len(self.manager.records) > 0
-            self.save_button.config(state='normal' if has_records else 'disabled')
-            self.reset_button.config(state='normal' if has_records else 'disabled')
-            
-            # Update button colors
+            has_records = self.manager.record_count > 0
+            button_state = 'normal' if has_records else 'disabled'
             button_bg = 'yellow' if (has_records and self.manager.has_unsaved_changes) else 'white'
-            if self.system == "Darwin":
-                self.save_button.config(highlightbackground=button_bg)
-                self.reset_button.config(highlightbackground='white')
-            else:
-                self.save_button.config(bg=button_bg)
-                self.reset_button.config(bg='white')
-                
+
+            # Skip the Tk calls when nothing has changed since the last update
+            if (button_state, button_bg) == self._last_button_state:
+                return
+            self._last_button_state = (button_state, button_bg)
+
+            # Update state and colour in one call; the reset button keeps the
+            # white it was created with
+            self.save_button.config(state=button_state, **{self._button_bg_option: button_bg})
+            self.reset_button.config(state=button_state)
+
         except TclError as e:
             logging.error(f"Failed to update button state: {str(e)}")
 
     def update_status(self, message: str):
-        """Update status with clean messages and auto-scroll."""
+        """Queue a status message; messages arriving together are shown in one update."""
+        self._pending_status.append(f"{message}\n")
+        if not self._status_flush_scheduled:
+            self._status_flush_scheduled = True
+            self.window.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Write queued status messages to the text widget and auto-scroll."""
         try:
-            status_line = f"{message}\n"
-            
-            # Store in history
-            self.status_messages.append(status_line)
-            
+            self._status_flush_scheduled = False
+            status_lines = "".join(self._pending_status)
+            self._pending_status.clear()
+
+            # Only follow new messages if the user has not scrolled back through the log
+            at_bottom = self.status_text.yview()[1] >= 1.0
+
             # Update text widget
             self.status_text.configure(state='normal')
-            self.status_text.insert(END, status_line)
-            self.status_text.see(END)  # Auto-scroll to bottom
+            self.status_text.insert(END, status_lines)
+            # 'end-1c' sits on the empty line after the last message
+            line_count = int(self.status_text.index('end-1c').split('.')[0]) - 1
+            if line_count > self.MAX_STATUS_LINES:
+                self.status_text.delete('1.0', f"{line_count - self.MAX_STATUS_LINES + 1}.0")
+            if at_bottom:
+                self.status_text.see(END)  # Auto-scroll to bottom
             self.status_text.configure(state='disabled')
-            
-            # Update count bar and ensure visibility
-            self.update_count_bar()
-            
+
         except TclError as e:
             logging.error(f"Failed to update status: {str(e)}")
 
+    def schedule_display_update(self):
+        """Observer callback: run update_display once when Tk is next idle."""
+        if threading.current_thread() is not threading.main_thread():
+            return  # Notified from a loader thread; _poll_load refreshes when it finishes
+        if not self._display_update_scheduled:
+            self._display_update_scheduled = True
+            self.window.after_idle(self._run_display_update)
+
+    def _run_display_update(self):
+        self._display_update_scheduled = False
+        self.update_display()
+
     def update_display(self):
         """Update both status text and save button state."""
         try:
             self.update_save_button_state()
             self.update_count_bar()
-            self.window.update_idletasks()
         except TclError as e:
             logging.error(f"Failed to update display: {str(e)}")
 
-    def truncate_path(self, path: str, max_length: int = 100) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def truncate_path(path: str, max_length: int = 100) -> str:
         """Truncate long path names for display."""
         if len(path) <= max_length:
             return path
@@ -865,7 +1067,7 @@ if __name__ == "__main__":
         app.manager = manager
         
         # Add observer for updates
-        manager.add_observer(app.update_display)
+        manager.add_observer(app.schedule_display_update)
         
         # Run the application
         app.run()